@@ -6,6 +6,7 @@ Integrates Model Context Protocol tools for enhanced analytics capabilities
 import json
 import logging
 import asyncio
+import functools
 import subprocess
 import os
 from typing import Dict, Any, List, Optional, Union
@@ -13,8 +14,32 @@ from datetime import datetime
 # import pandas as pd
 # import numpy as np
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Keyword groups used to route a query to relevant MCP tools
+QUERY_KEYWORD_GROUPS = (
+    ('database', ('sql', 'database', 'table', 'query', 'select')),
+    ('aws', ('aws', 'amazon', 's3', 'athena', 'redshift', 'glue')),
+    ('analysis', ('analyze', 'statistics', 'correlation', 'anomaly', 'trend')),
+    ('visualization', ('chart', 'graph', 'plot', 'visualize', 'dashboard')),
+    ('files', ('file', 'csv', 'excel', 'data file', 'export')),
+    ('external', ('latest', 'current', 'market', 'trends', 'news'))
+)
+
+# All keywords matched in a single pass over the query when pyahocorasick is installed
+if AHOCORASICK_AVAILABLE:
+    QUERY_KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for group, keywords in QUERY_KEYWORD_GROUPS:
+        for keyword in keywords:
+            QUERY_KEYWORD_AUTOMATON.add_word(keyword, group)
+    QUERY_KEYWORD_AUTOMATON.make_automaton()
+
 class MCPAnalyticsTools:
     """
     Integration layer for MCP tools specifically for analytics use cases
@@ -277,10 +302,10 @@ class MCPAnalyticsTools:
         Determine which MCP tools are most relevant for a given query
         """
         relevant_tools = []
-        query_lower = query.lower()
+        matched_groups = self._match_keyword_groups(query.lower())
         
         # Database-related queries
-        if any(keyword in query_lower for keyword in ['sql', 'database', 'table', 'query', 'select']):
+        if 'database' in matched_groups:
             if 'postgres' in self.available_tools and self.available_tools['postgres']:
                 relevant_tools.append({
                     'tool': 'postgres',
@@ -290,7 +315,7 @@ class MCPAnalyticsTools:
                 })
         
         # AWS-related queries
-        if any(keyword in query_lower for keyword in ['aws', 'amazon', 's3', 'athena', 'redshift', 'glue']):
+        if 'aws' in matched_groups:
             if 'aws-docs' in self.available_tools and self.available_tools['aws-docs']:
                 relevant_tools.append({
                     'tool': 'aws-docs',
@@ -308,7 +333,7 @@ class MCPAnalyticsTools:
                 })
         
         # Data analysis queries
-        if any(keyword in query_lower for keyword in ['analyze', 'statistics', 'correlation', 'anomaly', 'trend']):
+        if 'analysis' in matched_groups:
             if 'data-analysis' in self.available_tools and self.available_tools['data-analysis']:
                 relevant_tools.append({
                     'tool': 'data-analysis',
@@ -318,7 +343,7 @@ class MCPAnalyticsTools:
                 })
         
         # Visualization queries
-        if any(keyword in query_lower for keyword in ['chart', 'graph', 'plot', 'visualize', 'dashboard']):
+        if 'visualization' in matched_groups:
             if 'visualization' in self.available_tools and self.available_tools['visualization']:
                 relevant_tools.append({
                     'tool': 'visualization',
@@ -328,7 +353,7 @@ class MCPAnalyticsTools:
                 })
         
         # File operations
-        if any(keyword in query_lower for keyword in ['file', 'csv', 'excel', 'data file', 'export']):
+        if 'files' in matched_groups:
             if 'filesystem' in self.available_tools and self.available_tools['filesystem']:
                 relevant_tools.append({
                     'tool': 'filesystem',
@@ -338,7 +363,7 @@ class MCPAnalyticsTools:
                 })
         
         # External data queries
-        if any(keyword in query_lower for keyword in ['latest', 'current', 'market', 'trends', 'news']):
+        if 'external' in matched_groups:
             if 'web-search' in self.available_tools and self.available_tools['web-search']:
                 relevant_tools.append({
                     'tool': 'web-search',
@@ -349,6 +374,20 @@ class MCPAnalyticsTools:
         
         return relevant_tools
     
+    def get_relevant_tools_for_queries(self, queries: List[str]) -> List[List[Dict[str, Any]]]:
+        """
+        Determine relevant MCP tools for several queries at once
+        """
+        return [self.get_relevant_tools_for_query(query) for query in queries]
+    
+    def _match_keyword_groups(self, query_lower: str) -> set:
+        """
+        Return the keyword groups present in a lowercased query
+        """
+        if AHOCORASICK_AVAILABLE:
+            return {group for _, group in QUERY_KEYWORD_AUTOMATON.iter(query_lower)}
+        return {group for group, keywords in QUERY_KEYWORD_GROUPS if any(keyword in query_lower for keyword in keywords)}
+    
     async def execute_analytics_workflow(self, query: str, data_context: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         Execute a complete analytics workflow using relevant MCP tools
@@ -407,6 +446,77 @@ class MCPAnalyticsTools:
                 'results': {}
             }
     
+    async def execute_dag(self, nodes: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Execute MCP tool calls as a dependency graph
+        
+        Each node is a dict with 'id', 'tool', 'function', 'parameters' and an optional
+        'depends_on' list of node ids. Nodes whose dependencies are all done run
+        concurrently; nodes downstream of a failure are skipped and reported as failed.
+        """
+        dag_results = {
+            'workflow_steps': [],
+            'results': {},
+            'success': True
+        }
+        
+        def record_failure(node: Dict[str, Any], error: str, timestamp: Optional[str] = None):
+            dag_results['workflow_steps'].append({
+                'id': node['id'],
+                'tool': node['tool'],
+                'function': node['function'],
+                'success': False,
+                'timestamp': timestamp
+            })
+            dag_results['success'] = False
+            dag_results.setdefault('errors', []).append(error)
+        
+        pending = {node['id']: node for node in nodes}
+        completed = {}  # node id -> whether it succeeded
+        
+        while pending:
+            ready = [node for node in pending.values() if all(dep in completed for dep in node.get('depends_on', []))]
+            if not ready:
+                unresolved = ', '.join(sorted(pending))
+                logger.error(f"DAG has unresolvable dependencies: {unresolved}")
+                for node in pending.values():
+                    record_failure(node, f"Unresolvable dependencies for {node['id']}")
+                break
+            
+            for node in ready:
+                del pending[node['id']]
+            
+            runnable = []
+            for node in ready:
+                failed_deps = [dep for dep in node.get('depends_on', []) if not completed[dep]]
+                if failed_deps:
+                    # Mark as done-but-failed so its own dependents are skipped too
+                    completed[node['id']] = False
+                    record_failure(node, f"Skipped {node['id']}: dependencies failed ({', '.join(failed_deps)})")
+                else:
+                    runnable.append(node)
+            
+            outcomes = await asyncio.gather(*(
+                self.call_mcp_tool(node['tool'], node['function'], node.get('parameters', {}))
+                for node in runnable
+            ))
+            
+            for node, result in zip(runnable, outcomes):
+                completed[node['id']] = result['success']
+                if result['success']:
+                    dag_results['workflow_steps'].append({
+                        'id': node['id'],
+                        'tool': node['tool'],
+                        'function': node['function'],
+                        'success': True,
+                        'timestamp': result.get('timestamp')
+                    })
+                    dag_results['results'][node['id']] = result['result']
+                else:
+                    record_failure(node, result.get('error'), result.get('timestamp'))
+        
+        return dag_results
+    
     def _prepare_tool_parameters(self, tool_name: str, function_name: str, query: str, data_context: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         Prepare parameters for MCP tool calls based on context
@@ -509,4 +619,17 @@ class MCPAnalyticsTools:
             'total_tools': len(self.tool_capabilities),
             'active_tools': sum(1 for available in self.available_tools.values() if available),
             'last_updated': datetime.now().isoformat()
-        }
\ No newline at end of file
+        }
+    
+    @functools.cached_property
+    def tool_status(self) -> Dict[str, Any]:
+        """
+        Cached get_tool_status() snapshot; call invalidate_status() after availability changes
+        """
+        return self.get_tool_status()
+    
+    def invalidate_status(self):
+        """
+        Drop the cached tool status so the next read recomputes it
+        """
+        self.__dict__.pop('tool_status', None)
\ No newline at end of file
@@ -7,13 +7,142 @@ Tests the enhanced GUI with real AgentCore integration
 import sys
 import os
 import time
+import hashlib
 import requests
 import json
 from datetime import datetime
+from typing import Dict, Any, Optional
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
+try:
+    import faiss
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+    SEMANTIC_CACHE_AVAILABLE = True
+except ImportError:
+    SEMANTIC_CACHE_AVAILABLE = False
+
+# Cache settings for AgentCore test query responses
+CACHE_DIR = ".agentcore_test_cache"
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+SEMANTIC_THRESHOLD = 0.95
+CACHE_TTL = 3600  # seconds
+
+# Only live agent responses are cached; fallback mock responses are not
+CACHEABLE_METHODS = frozenset({"AgentCore Runtime", "HTTP Endpoint"})
+
+# Common agent endpoints to test, paired with their health check URLs
+AGENT_ENDPOINTS = tuple(
+    (endpoint, f"{endpoint}/health")
+    for endpoint in ("http://localhost:8080", "http://127.0.0.1:8080", os.getenv('AGENT_ENDPOINT'))
+    if endpoint
+)
 
 # Add gui directory to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'gui'))
 
+class QueryCache:
+    """On-disk semantic cache for AgentCore test query responses.
+    
+    Cache failures (unwritable directory, missing model, corrupt index) are
+    reported and treated as misses so they never fail the test itself.
+    """
+    
+    def __init__(self, agent_id: str):
+        self.agent_id = agent_id
+        self.cache = None
+        if DISKCACHE_AVAILABLE:
+            try:
+                self.cache = diskcache.Cache(CACHE_DIR)
+            except Exception as e:
+                print(f"⚠️  Query cache disabled: {e}")
+        self.semantic = self.cache is not None and SEMANTIC_CACHE_AVAILABLE
+        self.model = None
+        self.index = None
+        self.keys = []
+    
+    def _key(self, query: str) -> str:
+        """Exact-match key; includes the agent id so a new agent invalidates entries."""
+        return hashlib.sha256(f"{self.agent_id}:{query}".encode()).hexdigest()
+    
+    def _disable(self, error: Exception):
+        """Stop using the cache for the rest of the run after a failure."""
+        print(f"⚠️  Query cache disabled: {error}")
+        self.cache = None
+        self.semantic = False
+    
+    def _load_model(self):
+        """Load the embedding model on first use."""
+        if self.model is None:
+            self.model = SentenceTransformer(EMBEDDING_MODEL)
+        return self.model
+    
+    def _embed(self, query: str):
+        embedding = self._load_model().encode([query], normalize_embeddings=True)
+        return np.asarray(embedding, dtype='float32')
+    
+    def _load_index(self) -> bool:
+        """Build the in-memory FAISS index from stored embeddings; False if none are stored."""
+        if self.index is not None:
+            return True
+        stored = self.cache.get(f"embeddings:{self.agent_id}", [])
+        if not stored:
+            return False
+        self.index = faiss.IndexFlatIP(self._load_model().get_sentence_embedding_dimension())
+        for key, vector in stored:
+            self.index.add(np.asarray([vector], dtype='float32'))
+            self.keys.append(key)
+        return True
+    
+    def get(self, query: str) -> Optional[Dict[str, Any]]:
+        """Return a cached result for an exact or near-duplicate query."""
+        if self.cache is None:
+            return None
+        
+        try:
+            result = self.cache.get(self._key(query))
+            if result is not None or not self.semantic or not self._load_index():
+                return result
+            
+            scores, ids = self.index.search(self._embed(query), 1)
+            if scores[0][0] >= SEMANTIC_THRESHOLD:
+                return self.cache.get(self.keys[ids[0][0]])
+        except Exception as e:
+            self._disable(e)
+        return None
+    
+    def set(self, query: str, result: Dict[str, Any]):
+        """Store a successful live result and its query embedding; entries expire after CACHE_TTL."""
+        if self.cache is None or result.get("method") not in CACHEABLE_METHODS:
+            return
+        
+        try:
+            key = self._key(query)
+            self.cache.set(key, result, expire=CACHE_TTL)
+            
+            if self.semantic:
+                vector = self._embed(query)
+                if not self._load_index():
+                    self.index = faiss.IndexFlatIP(vector.shape[1])
+                self.index.add(vector)
+                self.keys.append(key)
+                embeddings = self.cache.get(f"embeddings:{self.agent_id}", [])
+                embeddings.append((key, vector[0].tolist()))
+                self.cache.set(f"embeddings:{self.agent_id}", embeddings, expire=CACHE_TTL)
+        except Exception as e:
+            self._disable(e)
+
 def test_agentcore_client():
     """Test AgentCore client functionality."""
     print("🧪 Testing AgentCore Client Integration")
@@ -44,11 +173,19 @@ def test_agentcore_client():
             "Analyze customer satisfaction trends"
         ]
         
+        query_cache = QueryCache(client.agent_id)
+        
         for i, query in enumerate(test_queries, 1):
             print(f"\n{i}. Testing query: '{query}'")
             
             start_time = time.time()
-            result = client.invoke_agent(query, f"test_session_{i}", "test_user")
+            result = query_cache.get(query)
+            if result is not None:
+                result = {**result, "method": "semantic-cache"}
+            else:
+                result = client.invoke_agent(query, f"test_session_{i}", "test_user")
+                if result["success"]:
+                    query_cache.set(query, result)
             response_time = time.time() - start_time
             
             if result["success"]:
@@ -106,22 +243,12 @@ def test_agent_endpoint():
     print("\n🧪 Testing Agent HTTP Endpoint")
     print("=" * 60)
     
-    # Common agent endpoints to test
-    endpoints = [
-        "http://localhost:8080",
-        "http://127.0.0.1:8080",
-        os.getenv('AGENT_ENDPOINT')
-    ]
-    
-    for endpoint in endpoints:
-        if not endpoint:
-            continue
-            
+    for endpoint, health_url in AGENT_ENDPOINTS:
         print(f"Testing endpoint: {endpoint}")
         
         try:
             # Test health endpoint
-            response = requests.get(f"{endpoint}/health", timeout=5)
+            response = requests.get(health_url, timeout=5)
             if response.status_code == 200:
                 print(f"✅ Health check passed: {endpoint}")
                 
@@ -173,14 +300,24 @@ def generate_test_report():
     deps_result = test_gui_dependencies()
     results["tests"]["dependencies"] = deps_result
     
-    # Test 2: AgentCore Client
+    critical_failed = not deps_result
+    
+    # Test 2: AgentCore Client (needs the GUI dependencies)
     print("\n2. Testing AgentCore client...")
-    client_result = test_agentcore_client()
+    if not critical_failed:
+        client_result = test_agentcore_client()
+    else:
+        print("⏭️  Skipped: missing dependencies")
+        client_result = False
     results["tests"]["agentcore_client"] = client_result
     
-    # Test 3: HTTP Endpoint
+    # Test 3: HTTP Endpoint (pointless if neither prerequisite passed)
     print("\n3. Testing HTTP endpoint...")
-    endpoint_result = test_agent_endpoint()
+    if deps_result or client_result:
+        endpoint_result = test_agent_endpoint()
+    else:
+        print("⏭️  Skipped: dependencies and AgentCore client both failed")
+        endpoint_result = None
     results["tests"]["http_endpoint"] = endpoint_result is not None
     
     # Summary
@@ -188,7 +325,7 @@ def generate_test_report():
     print("=" * 60)
     
     total_tests = len(results["tests"])
-    passed_tests = sum(1 for result in results["tests"].values() if result)
+    passed_tests = sum(map(bool, results["tests"].values()))
     
     print(f"Total Tests: {total_tests}")
     print(f"Passed: {passed_tests}")
@@ -214,8 +351,12 @@ def generate_test_report():
     
     # Save report
     report_file = 'gui_integration_test_report.json'
-    with open(report_file, 'w') as f:
-        json.dump(results, f, indent=2)
+    if ORJSON_AVAILABLE:
+        with open(report_file, 'wb') as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    else:
+        with open(report_file, 'w') as f:
+            json.dump(results, f, indent=2)
     print(f"\n📄 Detailed report saved to: {report_file}")
     
     return passed_tests / total_tests
@@ -5,10 +5,49 @@ Tests the deployed GUI at http://analytics-gui-alb-1184070249.us-west-2.elb.amaz
 """
 
 import requests
+import asyncio
 import json
 import time
 from datetime import datetime
 
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Key GUI elements expected in the rendered page
+GUI_CHECKS = [
+    ("analytics agent", "Analytics Agent title"),
+    ("streamlit", "Streamlit framework"),
+    ("query", "Query input functionality"),
+    ("configuration", "Configuration options"),
+    ("agentcore", "AgentCore integration")
+]
+
+if AHOCORASICK_AVAILABLE:
+    GUI_CHECK_AUTOMATON = ahocorasick.Automaton()
+    for keyword, description in GUI_CHECKS:
+        GUI_CHECK_AUTOMATON.add_word(keyword, keyword)
+    GUI_CHECK_AUTOMATON.make_automaton()
+
+# Shared Bedrock client, created on first use
+_BEDROCK_CLIENT = None
+
+def _get_bedrock_client():
+    """Return the shared bedrock-agent-runtime client, creating it once."""
+    global _BEDROCK_CLIENT
+    if _BEDROCK_CLIENT is None:
+        import boto3
+        _BEDROCK_CLIENT = boto3.client('bedrock-agent-runtime', region_name='us-west-2')
+    return _BEDROCK_CLIENT
+
 def test_gui_health():
     """Test if the GUI is responding."""
     gui_url = "http://analytics-gui-alb-1184070249.us-west-2.elb.amazonaws.com"
@@ -47,6 +86,14 @@ def test_gui_health():
         print(f"❌ Error testing GUI: {e}")
         return False
 
+async def _probe_health_endpoints(health_endpoints):
+    """Probe all health endpoints concurrently over one pooled client."""
+    async with httpx.AsyncClient(timeout=5) as client:
+        return await asyncio.gather(
+            *(client.get(endpoint) for endpoint in health_endpoints),
+            return_exceptions=True
+        )
+
 def test_streamlit_health():
     """Test Streamlit health endpoint."""
     gui_url = "http://analytics-gui-alb-1184070249.us-west-2.elb.amazonaws.com"
@@ -60,14 +107,28 @@ def test_streamlit_health():
         f"{gui_url}/health"
     ]
     
-    for endpoint in health_endpoints:
+    responses = None
+    if HTTPX_AVAILABLE:
         try:
-            response = requests.get(endpoint, timeout=5)
-            if response.status_code == 200:
+            responses = asyncio.run(_probe_health_endpoints(health_endpoints))
+        except Exception:
+            # Fall back to probing one endpoint at a time below
+            responses = None
+    
+    if responses is not None:
+        for endpoint, response in zip(health_endpoints, responses):
+            if not isinstance(response, Exception) and response.status_code == 200:
                 print(f"✅ Health endpoint working: {endpoint}")
                 return True
-        except:
-            continue
+    else:
+        for endpoint in health_endpoints:
+            try:
+                response = requests.get(endpoint, timeout=5)
+                if response.status_code == 200:
+                    print(f"✅ Health endpoint working: {endpoint}")
+                    return True
+            except:
+                continue
     
     print("⚠️  No standard health endpoints found (normal for Streamlit)")
     return True
@@ -77,10 +138,8 @@ def test_agentcore_connection():
     print("\n🔍 Testing AgentCore connection from local environment...")
     
     try:
-        import boto3
-        
         # Test AgentCore client
-        client = boto3.client('bedrock-agent-runtime', region_name='us-west-2')
+        client = _get_bedrock_client()
         
         # Try to invoke the agent (this will likely fail due to validation but shows connectivity)
         try:
@@ -118,18 +177,16 @@ def test_gui_functionality():
         response = requests.get(gui_url, timeout=10)
         content = response.text.lower()
         
-        # Check for key GUI elements
-        checks = [
-            ("analytics agent", "Analytics Agent title"),
-            ("streamlit", "Streamlit framework"),
-            ("query", "Query input functionality"),
-            ("configuration", "Configuration options"),
-            ("agentcore", "AgentCore integration")
-        ]
+        # Check for key GUI elements in a single pass when possible
+        checks = GUI_CHECKS
+        if AHOCORASICK_AVAILABLE:
+            found = {keyword for _, keyword in GUI_CHECK_AUTOMATON.iter(content)}
+        else:
+            found = {keyword for keyword, _ in checks if keyword in content}
         
         passed_checks = 0
         for keyword, description in checks:
-            if keyword in content:
+            if keyword in found:
                 print(f"✅ {description} found")
                 passed_checks += 1
             else:
@@ -181,8 +238,12 @@ def main():
     # Test 1: GUI Health
     results['gui_health'] = test_gui_health()
     
-    # Test 2: Streamlit Health
-    results['streamlit_health'] = test_streamlit_health()
+    # Test 2: Streamlit Health (a healthy root already proves Streamlit is up)
+    if results['gui_health']:
+        print("\n🔍 Skipping Streamlit health endpoints (root responded)")
+        results['streamlit_health'] = True
+    else:
+        results['streamlit_health'] = test_streamlit_health()
     
     # Test 3: AgentCore Connection
     results['agentcore_connection'] = test_agentcore_connection()
@@ -195,7 +256,7 @@ def main():
     print("=" * 60)
     
     total_tests = len(results)
-    passed_tests = sum(1 for result in results.values() if result)
+    passed_tests = sum(map(bool, results.values()))
     
     print(f"Total Tests: {total_tests}")
     print(f"Passed: {passed_tests}")
@@ -0,0 +1,33 @@
+"""
+Shared pytest fixtures for the database integration tests
+
+Run with pytest-xdist to spread tests across cores:
+    pytest -n auto temp/
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Make the agent package importable regardless of the invocation directory;
+# test modules rely on this rather than each patching sys.path themselves
+AGENT_DIR = str(Path(__file__).resolve().parent.parent / 'agent')
+if AGENT_DIR not in sys.path:
+    sys.path.insert(0, AGENT_DIR)
+
+from db_test_helpers import mocked_dependencies
+
+
+@pytest.fixture(scope='module')
+def mocked_modules():
+    """Install the stubbed third-party modules for one test module, then restore sys.modules"""
+    with mocked_dependencies():
+        yield
+
+
+@pytest.fixture(scope='module')
+def db(mocked_modules):
+    """Database integration instance shared by the tests in one module"""
+    from database_integration import get_database_integration
+    return get_database_integration()
@@ -0,0 +1,132 @@
+"""
+Shared helpers for the database integration test scripts
+"""
+
+import contextlib
+import functools
+import json
+import sys
+from types import MappingProxyType
+
+# DatabaseIntegration has no batch API, so the batch check sends these
+# shape-compatible statements as a single UNION ALL round trip
+BATCH_STATEMENTS = ("SELECT 1 AS value", "SELECT 2 AS value", "SELECT 3 AS value")
+BATCH_QUERY = " UNION ALL ".join(BATCH_STATEMENTS)
+
+def call_safely(func, arg):
+    """Call func(arg), returning (result, error) so one failure doesn't stop a batch"""
+    try:
+        return func(arg), None
+    except Exception as e:
+        return None, e
+
+# Secret payload returned by the mocked Secrets Manager client
+_SECRET_RESPONSE = {
+    'SecretString': json.dumps({
+        'db_username': 'test_user',
+        'db_password': 'test_pass',
+        'db_host': 'test_host',
+        'db_port': '5432',
+        'db_name': 'test_db'
+    })
+}
+
+# Lightweight stand-ins exposing only the attributes database_integration uses;
+# plain attribute access is much cheaper than unittest.mock's __getattr__ machinery
+class _DataFrameStub:
+    __slots__ = ()
+    columns = ['test']
+    
+    def __init__(self, data=None):
+        pass
+    
+    def __len__(self):
+        return 1
+    
+    def head(self, n=5):
+        return self
+    
+    def to_dict(self, orient='dict'):
+        return [{'test': 'data'}]
+
+class _PandasStub:
+    __slots__ = ()
+    DataFrame = _DataFrameStub
+
+class _Boto3ClientStub:
+    __slots__ = ()
+    
+    def get_secret_value(self, **kwargs):
+        return _SECRET_RESPONSE
+
+class _Boto3Stub:
+    __slots__ = ('_client',)
+    
+    def __init__(self):
+        self._client = _Boto3ClientStub()
+    
+    def client(self, *args, **kwargs):
+        return self._client
+
+class _BotocoreExceptionsStub:
+    __slots__ = ()
+    ClientError = Exception
+
+class _BotocoreStub:
+    __slots__ = ()
+    exceptions = _BotocoreExceptionsStub()
+
+class _Psycopg2ExtrasStub:
+    __slots__ = ()
+    RealDictCursor = object
+
+class _Psycopg2Stub:
+    __slots__ = ()
+    pool = None
+    extras = _Psycopg2ExtrasStub()
+
+class _SqlAlchemyStub:
+    __slots__ = ()
+    
+    @staticmethod
+    def create_engine(*args, **kwargs):
+        return None
+    
+    @staticmethod
+    def text(sql):
+        return sql
+
+class _SqlParseStub:
+    __slots__ = ()
+
+@functools.lru_cache(maxsize=1)
+def _build_mocks():
+    """Build stub modules for missing dependencies (once per process)"""
+    botocore_stub = _BotocoreStub()
+    return MappingProxyType({
+        'pandas': _PandasStub(),
+        'boto3': _Boto3Stub(),
+        'botocore': botocore_stub,
+        'botocore.exceptions': botocore_stub.exceptions,
+        'psycopg2': _Psycopg2Stub(),
+        'sqlalchemy': _SqlAlchemyStub(),
+        'sqlparse': _SqlParseStub()
+    })
+
+@contextlib.contextmanager
+def mocked_dependencies():
+    """Install the stub modules, restoring sys.modules on exit
+
+    database_integration is dropped too, so a copy imported against the stubs
+    never outlives them.
+    """
+    mocks = _build_mocks()
+    names = (*mocks, 'database_integration')
+    saved = {name: sys.modules[name] for name in names if name in sys.modules}
+    sys.modules.update(mocks)
+    try:
+        yield
+    finally:
+        for name in names:
+            sys.modules.pop(name, None)
+        sys.modules.update(saved)
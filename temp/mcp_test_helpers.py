@@ -0,0 +1,26 @@
+"""
+Shared helpers for the MCP test scripts
+"""
+
+import functools
+import json
+import os
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+MCP_CONFIG_PATH = '.kiro/settings/mcp.json'
+
+@functools.lru_cache(maxsize=1)
+def _parse_mcp_config(path, mtime_ns):
+    """Parse the MCP config; keyed on mtime so edits invalidate the cache"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+def load_mcp_config(path=MCP_CONFIG_PATH):
+    """Return the parsed MCP config, reading the file only when it has changed"""
+    return _parse_mcp_config(path, os.stat(path).st_mtime_ns)
@@ -9,97 +9,89 @@ import os
 import json
 import time
 import logging
-from unittest.mock import Mock, MagicMock
+import bisect
+import functools
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from array import array
+
+from db_test_helpers import BATCH_QUERY, BATCH_STATEMENTS, call_safely, mocked_dependencies
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def setup_mocks():
-    """Set up mocks for missing dependencies"""
-    # Mock pandas
-    pandas_mock = Mock()
-    pandas_mock.DataFrame = Mock()
-    pandas_mock.DataFrame.return_value.to_dict.return_value = [{'test': 'data'}]
-    pandas_mock.DataFrame.return_value.head.return_value = pandas_mock.DataFrame.return_value
-    pandas_mock.DataFrame.return_value.columns = ['test']
-    pandas_mock.DataFrame.return_value.__len__ = Mock(return_value=1)
-    sys.modules['pandas'] = pandas_mock
-    
-    # Mock boto3
-    boto3_mock = Mock()
-    client_mock = Mock()
-    client_mock.get_secret_value.return_value = {
-        'SecretString': json.dumps({
-            'db_username': 'test_user',
-            'db_password': 'test_pass',
-            'db_host': 'test_host',
-            'db_port': '5432',
-            'db_name': 'test_db'
-        })
-    }
-    boto3_mock.client.return_value = client_mock
-    sys.modules['boto3'] = boto3_mock
-    
-    # Mock botocore
-    botocore_mock = Mock()
-    botocore_mock.exceptions.ClientError = Exception
-    sys.modules['botocore'] = botocore_mock
-    sys.modules['botocore.exceptions'] = botocore_mock.exceptions
-    
-    # Mock psycopg2
-    psycopg2_mock = Mock()
-    psycopg2_mock.pool = Mock()
-    psycopg2_mock.extras = Mock()
-    psycopg2_mock.extras.RealDictCursor = Mock()
-    sys.modules['psycopg2'] = psycopg2_mock
-    
-    # Mock sqlalchemy
-    sqlalchemy_mock = Mock()
-    sqlalchemy_mock.create_engine = Mock()
-    sqlalchemy_mock.text = Mock()
-    sys.modules['sqlalchemy'] = sqlalchemy_mock
-    
-    # Mock sqlparse
-    sqlparse_mock = Mock()
-    sys.modules['sqlparse'] = sqlparse_mock
+# Precomputed output fragments
+_BANNER = "=" * 60
+_HEADER = f"\n{_BANNER}\n📊 FINAL TEST SUMMARY\n{_BANNER}"
+_PASS_PREFIX = "✅ "
+_FAIL_PREFIX = "❌ "
+
+_REQUIRED_SCHEMA_FIELDS = frozenset({'schemas', 'tables', 'total_tables', 'total_columns'})
+
+# Success-rate ladder: _RESULT_CATEGORIES[i] applies below _RESULT_THRESHOLDS[i]
+_RESULT_THRESHOLDS = (60, 75, 90)
+_RESULT_CATEGORIES = (
+    ("🎯 NEEDS IMPROVEMENT ❌", "Database integration needs significant work."),
+    ("🎯 ACCEPTABLE ⚠️", "Database integration is working with minor issues."),
+    ("🎯 GOOD ✅", "Database integration is working well!"),
+    ("🎯 EXCELLENT ✅", "Database integration is working excellently!"),
+)
 
 def test_database_integration_final():
     """Final comprehensive test of database integration"""
+    # Stub missing dependencies for this run only
+    with mocked_dependencies():
+        return _run_final_suite()
+
+def _run_final_suite():
+    """Run every check against the stubbed dependencies and collect the results"""
     print("🚀 Final Database Integration Test Suite")
-    print("=" * 60)
-    
-    # Set up mocks first
-    setup_mocks()
+    print(_BANNER)
     
     test_results = {
         'total_tests': 0,
         'passed_tests': 0,
         'failed_tests': 0,
         'test_details': [],
-        'start_time': time.time()
+        'start_time_ns': time.time_ns()
     }
+    # Monotonic clock for the duration only; its values mean nothing outside this process
+    suite_start = time.perf_counter_ns()
+    
+    # Per-test records kept column-wise; zipped into test_details on every exit path
+    test_names = []
+    test_successes = array('b')
+    test_messages = []
+    test_timestamps = array('q')
     
     def add_test_result(test_name: str, success: bool, message: str):
         test_results['total_tests'] += 1
         if success:
             test_results['passed_tests'] += 1
-            print(f"✅ {test_name}: {message}")
+            print(_PASS_PREFIX, test_name, ": ", message, sep="")
         else:
             test_results['failed_tests'] += 1
-            print(f"❌ {test_name}: {message}")
+            print(_FAIL_PREFIX, test_name, ": ", message, sep="")
         
-        test_results['test_details'].append({
-            'test_name': test_name,
-            'success': success,
-            'message': message,
-            'timestamp': time.time()
-        })
+        test_names.append(test_name)
+        test_successes.append(success)
+        test_messages.append(message)
+        test_timestamps.append(time.time_ns())
+    
+    def collect_test_details():
+        test_results['test_details'] = [
+            {'test_name': name, 'success': bool(success), 'message': message, 'timestamp_ns': timestamp_ns}
+            for name, success, message, timestamp_ns in zip(test_names, test_successes, test_messages, test_timestamps)
+        ]
     
     try:
-        # Add agent directory to path
-        sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'agent'))
-        
         # Test 1: Import database integration
         print("\n📋 Test 1: Module Import")
         try:
@@ -112,20 +104,22 @@ def test_database_integration_final():
         # Test 2: Initialize database integration
         print("\n📋 Test 2: Initialization")
         try:
-            db = DatabaseIntegration()
+            instance = DatabaseIntegration()
             add_test_result("Initialization", True, "Database integration initialized successfully")
             
             # Check basic attributes
-            if hasattr(db, 'connection_string'):
+            if hasattr(instance, 'connection_string'):
                 add_test_result("Connection String Attr", True, "connection_string attribute exists")
             else:
                 add_test_result("Connection String Attr", False, "connection_string attribute missing")
             
-            if hasattr(db, 'schema_cache'):
+            if hasattr(instance, 'schema_cache'):
                 add_test_result("Schema Cache Attr", True, "schema_cache attribute exists")
             else:
                 add_test_result("Schema Cache Attr", False, "schema_cache attribute missing")
-                
+            
+            # Later tests share the production singleton instead of a second instance
+            db = get_database_integration()
         except Exception as e:
             add_test_result("Initialization", False, f"Initialization failed: {str(e)}")
             return test_results
@@ -133,9 +127,7 @@ def test_database_integration_final():
         # Test 3: Singleton pattern
         print("\n📋 Test 3: Singleton Pattern")
         try:
-            db1 = get_database_integration()
-            db2 = get_database_integration()
-            if db1 is db2:
+            if get_database_integration() is db:
                 add_test_result("Singleton Pattern", True, "Singleton pattern working correctly")
             else:
                 add_test_result("Singleton Pattern", False, "Different instances returned")
@@ -175,11 +167,11 @@ def test_database_integration_final():
         
         # Test 6: Schema discovery
         print("\n📋 Test 6: Schema Discovery")
+        schema = None
         try:
             schema = db.discover_schema()
             if isinstance(schema, dict):
-                required_fields = ['schemas', 'tables', 'total_tables', 'total_columns']
-                missing_fields = [f for f in required_fields if f not in schema]
+                missing_fields = _REQUIRED_SCHEMA_FIELDS - schema.keys()
                 
                 if not missing_fields:
                     add_test_result("Schema Structure", True, "All required schema fields present")
@@ -189,8 +181,13 @@ def test_database_integration_final():
                         add_test_result("Schema Content", True, f"Found {total_tables} tables")
                     else:
                         add_test_result("Schema Content", True, "Schema discovery working (simulated)")
+                    
+                    if db.schema_cache is schema:
+                        add_test_result("Schema Caching", True, "Discovered schema stored in schema_cache")
+                    else:
+                        add_test_result("Schema Caching", False, "schema_cache not updated by discovery")
                 else:
-                    add_test_result("Schema Structure", False, f"Missing fields: {missing_fields}")
+                    add_test_result("Schema Structure", False, f"Missing fields: {sorted(missing_fields)}")
             else:
                 add_test_result("Schema Discovery", False, "Invalid schema format")
         except Exception as e:
@@ -204,17 +201,22 @@ def test_database_integration_final():
             "Analyze customers"
         ]
         
+        # Reuse the schema discovered in Test 6 rather than rediscovering per query
+        generate = functools.partial(db.generate_sql_from_natural_language, schema_info=schema)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            outcomes = list(executor.map(
+                functools.partial(call_safely, generate), test_queries
+            ))
+        
         successful_generations = 0
-        for i, query in enumerate(test_queries, 1):
-            try:
-                result = db.generate_sql_from_natural_language(query)
-                if isinstance(result, dict) and result.get('success'):
-                    successful_generations += 1
-                    add_test_result(f"SQL Gen {i}", True, f"Generated SQL for '{query[:20]}...'")
-                else:
-                    add_test_result(f"SQL Gen {i}", False, f"Failed for '{query[:20]}...'")
-            except Exception as e:
-                add_test_result(f"SQL Gen {i}", False, f"Error: {str(e)}")
+        for i, (query, (result, error)) in enumerate(zip(test_queries, outcomes), 1):
+            if error is not None:
+                add_test_result(f"SQL Gen {i}", False, f"Error: {str(error)}")
+            elif isinstance(result, dict) and result.get('success'):
+                successful_generations += 1
+                add_test_result(f"SQL Gen {i}", True, f"Generated SQL for '{query[:20]}...'")
+            else:
+                add_test_result(f"SQL Gen {i}", False, f"Failed for '{query[:20]}...'")
         
         success_rate = successful_generations / len(test_queries)
         add_test_result("SQL Generation Overall", success_rate >= 0.5, f"Success rate: {success_rate:.1%}")
@@ -223,21 +225,31 @@ def test_database_integration_final():
         print("\n📋 Test 8: Query Execution")
         test_queries = ["SELECT 1", "SELECT 'test'"]
         
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            outcomes = list(executor.map(functools.partial(call_safely, db.execute_query), test_queries))
+        
         successful_executions = 0
-        for i, query in enumerate(test_queries, 1):
-            try:
-                result = db.execute_query(query)
-                if isinstance(result, dict) and result.get('success'):
-                    successful_executions += 1
-                    add_test_result(f"Query Exec {i}", True, f"Executed: {query}")
-                else:
-                    add_test_result(f"Query Exec {i}", False, f"Failed: {query}")
-            except Exception as e:
-                add_test_result(f"Query Exec {i}", False, f"Error: {str(e)}")
+        for i, (query, (result, error)) in enumerate(zip(test_queries, outcomes), 1):
+            if error is not None:
+                add_test_result(f"Query Exec {i}", False, f"Error: {str(error)}")
+            elif isinstance(result, dict) and result.get('success'):
+                successful_executions += 1
+                add_test_result(f"Query Exec {i}", True, f"Executed: {query}")
+            else:
+                add_test_result(f"Query Exec {i}", False, f"Failed: {query}")
         
         exec_rate = successful_executions / len(test_queries)
         add_test_result("Query Execution Overall", exec_rate >= 0.5, f"Success rate: {exec_rate:.1%}")
         
+        result, error = call_safely(db.execute_query, BATCH_QUERY)
+        if error is not None:
+            add_test_result("Query Exec Batch", False, f"Error: {str(error)}")
+        elif isinstance(result, dict) and result.get('success'):
+            add_test_result("Query Exec Batch", True, f"Executed {len(BATCH_STATEMENTS)} statements in one call")
+        else:
+            message = result.get('message', 'Unknown error') if isinstance(result, dict) else str(result)
+            add_test_result("Query Exec Batch", False, f"Batch failed: {message}")
+        
         # Test 9: Error handling
         print("\n📋 Test 9: Error Handling")
         try:
@@ -262,19 +274,19 @@ def test_database_integration_final():
             'execute_query'
         ]
         
+        # One scan of the class instead of hasattr/getattr per method
+        callable_names = {name for name, _ in inspect.getmembers(type(db), callable)}
         for method in required_methods:
-            if hasattr(db, method) and callable(getattr(db, method)):
+            if method in callable_names:
                 add_test_result(f"Method {method}", True, f"{method} method available")
             else:
                 add_test_result(f"Method {method}", False, f"{method} method missing")
         
         # Generate final summary
-        execution_time = time.time() - test_results['start_time']
+        execution_time = (time.perf_counter_ns() - suite_start) / 1e9
         test_results['execution_time'] = execution_time
         
-        print("\n" + "=" * 60)
-        print("📊 FINAL TEST SUMMARY")
-        print("=" * 60)
+        print(_HEADER)
         
         total = test_results['total_tests']
         passed = test_results['passed_tests']
@@ -288,18 +300,7 @@ def test_database_integration_final():
         print(f"Execution Time: {execution_time:.2f}s")
         
         # Categorize results
-        if success_rate >= 90:
-            result_category = "🎯 EXCELLENT ✅"
-            result_message = "Database integration is working excellently!"
-        elif success_rate >= 75:
-            result_category = "🎯 GOOD ✅"
-            result_message = "Database integration is working well!"
-        elif success_rate >= 60:
-            result_category = "🎯 ACCEPTABLE ⚠️"
-            result_message = "Database integration is working with minor issues."
-        else:
-            result_category = "🎯 NEEDS IMPROVEMENT ❌"
-            result_message = "Database integration needs significant work."
+        result_category, result_message = _RESULT_CATEGORIES[bisect.bisect_right(_RESULT_THRESHOLDS, success_rate)]
         
         print(f"\n{result_category}")
         print(result_message)
@@ -314,10 +315,18 @@ def test_database_integration_final():
         print("• Add more comprehensive error handling")
         
         # Save results
-        results_file = 'database_integration_final_results.json'
-        with open(results_file, 'w') as f:
-            json.dump(test_results, f, indent=2, default=str)
-        print(f"\n💾 Results saved to: {results_file}")
+        collect_test_details()
+        # Only write the results file when asked; CI otherwise just needs the exit code
+        if os.environ.get('SAVE_TEST_RESULTS', '0') == '1':
+            job_id = os.environ.get('CI_JOB_ID')
+            results_file = f'database_integration_final_results_{job_id}.json' if job_id else 'database_integration_final_results.json'
+            if ORJSON_AVAILABLE:
+                with open(results_file, 'wb') as f:
+                    f.write(orjson.dumps(test_results, option=orjson.OPT_INDENT_2, default=str))
+            else:
+                with open(results_file, 'w') as f:
+                    json.dump(test_results, f, indent=2, default=str)
+            print(f"\n💾 Results saved to: {results_file}")
         
         return test_results
         
@@ -326,6 +335,9 @@ def test_database_integration_final():
         import traceback
         traceback.print_exc()
         return test_results
+    finally:
+        # Early returns and failures still report the tests that ran
+        collect_test_details()
 
 if __name__ == "__main__":
     results = test_database_integration_final()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Pytest suite for database integration
+Covers the checks shared by test_db_final.py and test_db_integration_complete.py
+"""
+
+import pytest
+
+from db_test_helpers import BATCH_QUERY
+
+SQL_GENERATION_QUERIES = [
+    "Show me sales by region",
+    "What are the top selling products?",
+    "Analyze customer segments",
+    "Give me a general overview"
+]
+
+SQL_EXECUTION_QUERIES = [
+    "SELECT 1 as test_value",
+    "SELECT 'hello' as greeting, 42 as number"
+]
+
+REQUIRED_METHODS = [
+    'get_connection_string',
+    'test_connection',
+    'discover_schema',
+    'generate_sql_from_natural_language',
+    'execute_query'
+]
+
+
+def test_module_import(mocked_modules):
+    from database_integration import DatabaseIntegration, get_database_integration
+    assert callable(get_database_integration)
+    assert isinstance(DatabaseIntegration, type)
+
+
+def test_initialization(db):
+    assert hasattr(db, 'connection_string')
+    assert hasattr(db, 'schema_cache')
+
+
+def test_singleton(db):
+    from database_integration import get_database_integration
+    assert get_database_integration() is db
+
+
+def test_connection_string(db):
+    conn_str = db.get_connection_string()
+    assert isinstance(conn_str, str)
+    assert 'postgresql://' in conn_str
+
+
+def test_connection(db):
+    result = db.test_connection()
+    assert isinstance(result, dict)
+    assert result.get('success'), result.get('message', 'Unknown')
+
+
+@pytest.fixture(scope='module')
+def schema(db):
+    """Schema discovered once and reused by dependent tests"""
+    return db.discover_schema()
+
+
+def test_schema_discovery(db, schema):
+    assert isinstance(schema, dict)
+    missing_fields = {'schemas', 'tables', 'total_tables', 'total_columns'} - schema.keys()
+    assert not missing_fields
+    assert db.schema_cache is schema
+
+
+@pytest.mark.parametrize("query", SQL_GENERATION_QUERIES)
+def test_sql_generation(db, schema, query):
+    result = db.generate_sql_from_natural_language(query, schema_info=schema)
+    assert isinstance(result, dict)
+    assert result.get('success')
+    assert 'select' in result.get('sql_query', '').lower()
+
+
+@pytest.mark.parametrize("query", SQL_EXECUTION_QUERIES)
+def test_query_execution(db, query):
+    result = db.execute_query(query)
+    assert isinstance(result, dict)
+    assert result.get('success'), result.get('message', 'Unknown error')
+
+
+def test_query_execution_batch(db):
+    result = db.execute_query(BATCH_QUERY)
+    assert isinstance(result, dict)
+    assert result.get('success'), result.get('message', 'Unknown error')
+
+
+@pytest.mark.xfail(reason="stubbed psycopg2 cursor accepts any SQL", strict=False)
+def test_error_handling(db):
+    try:
+        result = db.execute_query("INVALID SQL")
+    except Exception:
+        return
+    assert isinstance(result, dict)
+    assert not result.get('success')
+
+
+@pytest.mark.parametrize("method", REQUIRED_METHODS)
+def test_method_available(db, method):
+    assert callable(getattr(type(db), method, None))
@@ -9,15 +9,44 @@ import os
 import json
 import time
 import logging
+import bisect
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from array import array
+
+from db_test_helpers import BATCH_QUERY, BATCH_STATEMENTS, call_safely
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Precomputed output fragments
+_BANNER = "=" * 60
+_HEADER = f"\n{_BANNER}\n📊 COMPLETE TEST SUMMARY\n{_BANNER}"
+_PASS_PREFIX = "✅ "
+_FAIL_PREFIX = "❌ "
+
+_REQUIRED_SCHEMA_FIELDS = frozenset({'schemas', 'tables', 'total_tables', 'total_columns'})
+
+# Success-rate ladder: _RESULT_CATEGORIES[i] applies below _RESULT_THRESHOLDS[i]
+_RESULT_THRESHOLDS = (40, 60, 80)
+_RESULT_CATEGORIES = (
+    ("❌ NEEDS WORK", "Database integration needs significant improvements."),
+    ("⚠️ FAIR", "Database integration has some issues that should be addressed."),
+    ("✅ GOOD", "Database integration is working well with minor issues."),
+    ("✅ EXCELLENT", "Database integration is working excellently!"),
+)
+
 def test_database_integration_complete():
     """Complete test of database integration with dependency handling"""
     print("🚀 Complete Database Integration Test Suite")
-    print("=" * 60)
+    print(_BANNER)
     
     test_results = {
         'total_tests': 0,
@@ -26,25 +55,31 @@ def test_database_integration_complete():
         'test_details': []
     }
     
+    # Per-test records kept column-wise; zipped into test_details on every exit path
+    test_names = []
+    test_successes = array('b')
+    test_messages = []
+    
     def add_test_result(test_name: str, success: bool, message: str):
         test_results['total_tests'] += 1
         if success:
             test_results['passed_tests'] += 1
-            print(f"✅ {test_name}: {message}")
+            print(_PASS_PREFIX, test_name, ": ", message, sep="")
         else:
             test_results['failed_tests'] += 1
-            print(f"❌ {test_name}: {message}")
+            print(_FAIL_PREFIX, test_name, ": ", message, sep="")
         
-        test_results['test_details'].append({
-            'test_name': test_name,
-            'success': success,
-            'message': message
-        })
+        test_names.append(test_name)
+        test_successes.append(success)
+        test_messages.append(message)
+    
+    def collect_test_details():
+        test_results['test_details'] = [
+            {'test_name': name, 'success': bool(success), 'message': message}
+            for name, success, message in zip(test_names, test_successes, test_messages)
+        ]
     
     try:
-        # Add agent directory to path
-        sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'agent'))
-        
         # Test 1: Import database integration
         print("\n📋 Test 1: Module Import")
         try:
@@ -57,17 +92,19 @@ def test_database_integration_complete():
         # Test 2: Initialize database integration
         print("\n📋 Test 2: Initialization")
         try:
-            db = DatabaseIntegration()
+            instance = DatabaseIntegration()
             add_test_result("Initialization", True, "Database integration initialized successfully")
             
             # Check attributes
             required_attrs = ['connection_string', 'schema_cache', 'query_cache']
             for attr in required_attrs:
-                if hasattr(db, attr):
+                if hasattr(instance, attr):
                     add_test_result(f"Attribute {attr}", True, f"{attr} attribute exists")
                 else:
                     add_test_result(f"Attribute {attr}", False, f"{attr} attribute missing")
-                    
+                
+            # Later tests share the production singleton instead of a second instance
+            db = get_database_integration()
         except Exception as e:
             add_test_result("Initialization", False, f"Initialization failed: {str(e)}")
             return test_results
@@ -75,9 +112,7 @@ def test_database_integration_complete():
         # Test 3: Singleton pattern
         print("\n📋 Test 3: Singleton Pattern")
         try:
-            db1 = get_database_integration()
-            db2 = get_database_integration()
-            if db1 is db2:
+            if get_database_integration() is db:
                 add_test_result("Singleton Pattern", True, "Singleton pattern working correctly")
             else:
                 add_test_result("Singleton Pattern", False, "Singleton pattern failed - different instances returned")
@@ -131,14 +166,14 @@ def test_database_integration_complete():
         
         # Test 6: Schema discovery
         print("\n📋 Test 6: Schema Discovery")
+        schema = None
         try:
             schema = db.discover_schema()
             if isinstance(schema, dict):
                 # Check for required fields
-                required_fields = ['schemas', 'tables', 'total_tables', 'total_columns']
-                all_fields_present = all(field in schema for field in required_fields)
+                missing_fields = _REQUIRED_SCHEMA_FIELDS - schema.keys()
                 
-                if all_fields_present:
+                if not missing_fields:
                     add_test_result("Schema Structure", True, "Schema has all required fields")
                     
                     total_tables = schema.get('total_tables', 0)
@@ -155,8 +190,7 @@ def test_database_integration_complete():
                     else:
                         add_test_result("Schema Caching", False, "Schema not cached")
                 else:
-                    missing_fields = [field for field in required_fields if field not in schema]
-                    add_test_result("Schema Structure", False, f"Missing fields: {missing_fields}")
+                    add_test_result("Schema Structure", False, f"Missing fields: {sorted(missing_fields)}")
             else:
                 add_test_result("Schema Discovery", False, "Schema discovery returned invalid format")
         except Exception as e:
@@ -171,21 +205,26 @@ def test_database_integration_complete():
             "Give me a general overview"
         ]
         
+        # Reuse the schema discovered in Test 6 rather than rediscovering per query
+        generate = functools.partial(db.generate_sql_from_natural_language, schema_info=schema)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            outcomes = list(executor.map(
+                functools.partial(call_safely, generate), test_queries
+            ))
+        
         successful_generations = 0
-        for i, query in enumerate(test_queries, 1):
-            try:
-                result = db.generate_sql_from_natural_language(query)
-                if isinstance(result, dict) and result.get('success'):
-                    successful_generations += 1
-                    sql_query = result.get('sql_query', '')
-                    if sql_query and 'select' in sql_query.lower():
-                        add_test_result(f"SQL Gen Query {i}", True, f"Generated valid SQL for '{query[:30]}...'")
-                    else:
-                        add_test_result(f"SQL Gen Query {i}", False, f"Generated invalid SQL for '{query[:30]}...'")
+        for i, (query, (result, error)) in enumerate(zip(test_queries, outcomes), 1):
+            if error is not None:
+                add_test_result(f"SQL Gen Query {i}", False, f"SQL generation error: {str(error)}")
+            elif isinstance(result, dict) and result.get('success'):
+                successful_generations += 1
+                sql_query = result.get('sql_query', '')
+                if sql_query and 'select' in sql_query.lower():
+                    add_test_result(f"SQL Gen Query {i}", True, f"Generated valid SQL for '{query[:30]}...'")
                 else:
-                    add_test_result(f"SQL Gen Query {i}", False, f"Failed to generate SQL for '{query[:30]}...'")
-            except Exception as e:
-                add_test_result(f"SQL Gen Query {i}", False, f"SQL generation error: {str(e)}")
+                    add_test_result(f"SQL Gen Query {i}", False, f"Generated invalid SQL for '{query[:30]}...'")
+            else:
+                add_test_result(f"SQL Gen Query {i}", False, f"Failed to generate SQL for '{query[:30]}...'")
         
         success_rate = successful_generations / len(test_queries)
         add_test_result("SQL Generation Overall", success_rate >= 0.5, f"Success rate: {success_rate:.1%}")
@@ -197,23 +236,34 @@ def test_database_integration_complete():
             "SELECT 'hello' as greeting, 42 as number"
         ]
         
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            outcomes = list(executor.map(functools.partial(call_safely, db.execute_query), test_sql_queries))
+        
         successful_executions = 0
-        for i, sql_query in enumerate(test_sql_queries, 1):
-            try:
-                result = db.execute_query(sql_query)
-                if isinstance(result, dict) and result.get('success'):
-                    successful_executions += 1
-                    row_count = result.get('row_count', 0)
-                    exec_time = result.get('execution_time_ms', 0)
-                    add_test_result(f"Query Exec {i}", True, f"Executed successfully: {row_count} rows in {exec_time}ms")
-                else:
-                    add_test_result(f"Query Exec {i}", False, f"Execution failed: {result.get('message', 'Unknown error')}")
-            except Exception as e:
-                add_test_result(f"Query Exec {i}", False, f"Query execution error: {str(e)}")
+        for i, (result, error) in enumerate(outcomes, 1):
+            if error is not None:
+                add_test_result(f"Query Exec {i}", False, f"Query execution error: {str(error)}")
+            elif isinstance(result, dict) and result.get('success'):
+                successful_executions += 1
+                row_count = result.get('row_count', 0)
+                exec_time = result.get('execution_time_ms', 0)
+                add_test_result(f"Query Exec {i}", True, f"Executed successfully: {row_count} rows in {exec_time}ms")
+            else:
+                message = result.get('message', 'Unknown error') if isinstance(result, dict) else str(result)
+                add_test_result(f"Query Exec {i}", False, f"Execution failed: {message}")
         
         exec_success_rate = successful_executions / len(test_sql_queries)
         add_test_result("Query Execution Overall", exec_success_rate >= 0.5, f"Success rate: {exec_success_rate:.1%}")
         
+        result, error = call_safely(db.execute_query, BATCH_QUERY)
+        if error is not None:
+            add_test_result("Query Exec Batch", False, f"Error: {str(error)}")
+        elif isinstance(result, dict) and result.get('success'):
+            add_test_result("Query Exec Batch", True, f"Executed {len(BATCH_STATEMENTS)} statements in one call")
+        else:
+            message = result.get('message', 'Unknown error') if isinstance(result, dict) else str(result)
+            add_test_result("Query Exec Batch", False, f"Batch failed: {message}")
+        
         # Test 9: Error handling
         print("\n📋 Test 9: Error Handling")
         try:
@@ -253,9 +303,7 @@ def test_database_integration_complete():
             add_test_result("Utility Methods", False, f"Utility methods test failed: {str(e)}")
         
         # Generate final summary
-        print("\n" + "=" * 60)
-        print("📊 COMPLETE TEST SUMMARY")
-        print("=" * 60)
+        print(_HEADER)
         
         total = test_results['total_tests']
         passed = test_results['passed_tests']
@@ -268,24 +316,23 @@ def test_database_integration_complete():
         print(f"Success Rate: {success_rate:.1f}%")
         
         # Determine overall result
-        if success_rate >= 80:
-            print(f"\n🎯 OVERALL RESULT: ✅ EXCELLENT")
-            print("Database integration is working excellently!")
-        elif success_rate >= 60:
-            print(f"\n🎯 OVERALL RESULT: ✅ GOOD")
-            print("Database integration is working well with minor issues.")
-        elif success_rate >= 40:
-            print(f"\n🎯 OVERALL RESULT: ⚠️ FAIR")
-            print("Database integration has some issues that should be addressed.")
-        else:
-            print(f"\n🎯 OVERALL RESULT: ❌ NEEDS WORK")
-            print("Database integration needs significant improvements.")
+        result_category, result_message = _RESULT_CATEGORIES[bisect.bisect_right(_RESULT_THRESHOLDS, success_rate)]
+        print(f"\n🎯 OVERALL RESULT: {result_category}")
+        print(result_message)
         
         # Save detailed results
-        results_file = 'database_integration_test_results.json'
-        with open(results_file, 'w') as f:
-            json.dump(test_results, f, indent=2)
-        print(f"\n💾 Detailed results saved to: {results_file}")
+        collect_test_details()
+        # Only write the results file when asked; CI otherwise just needs the exit code
+        if os.environ.get('SAVE_TEST_RESULTS', '0') == '1':
+            job_id = os.environ.get('CI_JOB_ID')
+            results_file = f'database_integration_test_results_{job_id}.json' if job_id else 'database_integration_test_results.json'
+            if ORJSON_AVAILABLE:
+                with open(results_file, 'wb') as f:
+                    f.write(orjson.dumps(test_results, option=orjson.OPT_INDENT_2, default=str))
+            else:
+                with open(results_file, 'w') as f:
+                    json.dump(test_results, f, indent=2)
+            print(f"\n💾 Detailed results saved to: {results_file}")
         
         return test_results
         
@@ -294,6 +341,9 @@ def test_database_integration_complete():
         import traceback
         traceback.print_exc()
         return test_results
+    finally:
+        # Early returns and failures still report the tests that ran
+        collect_test_details()
 
 if __name__ == "__main__":
     results = test_database_integration_complete()
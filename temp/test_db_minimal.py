@@ -6,8 +6,57 @@ Tests basic functionality without external dependencies
 
 import sys
 import os
+import re
+import mmap
 import json
 import time
+from types import MappingProxyType
+
+# Structural markers looked for in database_integration.py, matched in one pass
+_STRUCTURE_PATTERN = re.compile(rb'class DatabaseIntegration|def (?:test_connection|discover_schema|execute_query)')
+
+# Canned MockDatabaseIntegration responses, built once and shared read-only;
+# nested values are tuples and proxies too, since MappingProxyType only freezes the top level
+_CONN_RESULT = MappingProxyType({
+    'success': True,
+    'connection_method': 'mock',
+    'response_time_ms': 100,
+    'message': 'Mock connection test successful'
+})
+
+_SCHEMA_RESULT = MappingProxyType({
+    'success': True,
+    'schemas': ('public', 'sales'),
+    'tables': MappingProxyType({
+        'public': (
+            MappingProxyType({
+                'name': 'customers',
+                'columns': (
+                    MappingProxyType({'name': 'id', 'type': 'integer'}),
+                    MappingProxyType({'name': 'name', 'type': 'varchar'})
+                )
+            }),
+        )
+    }),
+    'total_tables': 1,
+    'total_columns': 2,
+    'discovery_method': 'mock'
+})
+
+_SQL_TEMPLATE = MappingProxyType({
+    'success': True,
+    'sql_query': 'SELECT * FROM customers',
+    'complexity': 'simple'
+})
+
+_EXEC_RESULT = MappingProxyType({
+    'success': True,
+    'data': (MappingProxyType({'id': 1, 'name': 'Test Customer'}),),
+    'columns': ('id', 'name'),
+    'row_count': 1,
+    'execution_time_ms': 50,
+    'query_method': 'mock'
+})
 
 def test_database_integration_minimal():
     """Test database integration with minimal dependencies"""
@@ -22,7 +71,7 @@ def test_database_integration_minimal():
         import logging
         import json
         import time
-        from typing import Dict, Any, List, Optional
+        from typing import Dict, Any, List, Mapping, Optional
         print("✅ Basic Python imports working")
         
         # Test 2: Check if we can create a simple database integration class
@@ -36,51 +85,17 @@ def test_database_integration_minimal():
             def get_connection_string(self) -> str:
                 return self.connection_string
             
-            def test_connection(self) -> Dict[str, Any]:
-                return {
-                    'success': True,
-                    'connection_method': 'mock',
-                    'response_time_ms': 100,
-                    'message': 'Mock connection test successful'
-                }
+            def test_connection(self) -> Mapping[str, Any]:
+                return _CONN_RESULT
             
-            def discover_schema(self) -> Dict[str, Any]:
-                return {
-                    'success': True,
-                    'schemas': ['public', 'sales'],
-                    'tables': {
-                        'public': [
-                            {
-                                'name': 'customers',
-                                'columns': [
-                                    {'name': 'id', 'type': 'integer'},
-                                    {'name': 'name', 'type': 'varchar'}
-                                ]
-                            }
-                        ]
-                    },
-                    'total_tables': 1,
-                    'total_columns': 2,
-                    'discovery_method': 'mock'
-                }
+            def discover_schema(self) -> Mapping[str, Any]:
+                return _SCHEMA_RESULT
             
             def generate_sql_from_natural_language(self, query: str) -> Dict[str, Any]:
-                return {
-                    'success': True,
-                    'sql_query': 'SELECT * FROM customers',
-                    'explanation': f'Mock SQL generation for: {query}',
-                    'complexity': 'simple'
-                }
+                return {**_SQL_TEMPLATE, 'explanation': f'Mock SQL generation for: {query}'}
             
-            def execute_query(self, sql_query: str) -> Dict[str, Any]:
-                return {
-                    'success': True,
-                    'data': [{'id': 1, 'name': 'Test Customer'}],
-                    'columns': ['id', 'name'],
-                    'row_count': 1,
-                    'execution_time_ms': 50,
-                    'query_method': 'mock'
-                }
+            def execute_query(self, sql_query: str) -> Mapping[str, Any]:
+                return _EXEC_RESULT
         
         # Test 3: Create and test mock database integration
         print("\n📋 Testing mock database integration...")
@@ -116,8 +131,6 @@ def test_database_integration_minimal():
         
         # Test 4: Check if we can import the actual database integration
         print("\n📋 Testing actual database integration import...")
-        sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'agent'))
-        
         try:
             # Try to import without pandas first
             import importlib.util
@@ -128,25 +141,26 @@ def test_database_integration_minimal():
                 print("✅ Database integration file exists")
                 
                 # Try to read the file and check its structure
-                with open(db_file, 'r') as f:
-                    content = f.read()
+                # Scan the page-mapped file directly rather than copying it into a string
+                with open(db_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    found = {m.group(0) for m in _STRUCTURE_PATTERN.finditer(mm)}
                     
-                if 'class DatabaseIntegration' in content:
+                if b'class DatabaseIntegration' in found:
                     print("✅ DatabaseIntegration class found in file")
                 else:
                     print("❌ DatabaseIntegration class not found in file")
                 
-                if 'def test_connection' in content:
+                if b'def test_connection' in found:
                     print("✅ test_connection method found")
                 else:
                     print("❌ test_connection method not found")
                 
-                if 'def discover_schema' in content:
+                if b'def discover_schema' in found:
                     print("✅ discover_schema method found")
                 else:
                     print("❌ discover_schema method not found")
                 
-                if 'def execute_query' in content:
+                if b'def execute_query' in found:
                     print("✅ execute_query method found")
                 else:
                     print("❌ execute_query method not found")
@@ -3,33 +3,85 @@
 Simple MCP Test - Tests one MCP tool quickly
 """
 
+import asyncio
 import subprocess
+import functools
 import json
+import shutil
 import sys
 import os
-import time
+from types import MappingProxyType
+
+from mcp_test_helpers import load_mcp_config
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Environment for spawned MCP servers, built once at import and shared read-only
+_MCP_ENV = MappingProxyType({
+    **os.environ,
+    'PATH': f"{os.path.expanduser('~/.local/bin')}:{os.environ.get('PATH', '')}",
+    'ALLOWED_DIRECTORIES': "/tmp,/data,."
+})
+
+def _encode_rpc(message):
+    """Serialize a JSON-RPC message as one newline-terminated line of bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(message) + b'\n'
+    return (json.dumps(message) + '\n').encode()
+
+def _decode_rpc(line):
+    """Parse one JSON-RPC line; raises json.JSONDecodeError on bad input"""
+    return orjson.loads(line) if ORJSON_AVAILABLE else json.loads(line)
+
+async def _readline_before(stream, deadline):
+    """Read one line, waiting at most until the event-loop time `deadline`"""
+    remaining = max(deadline - asyncio.get_running_loop().time(), 0)
+    return await asyncio.wait_for(stream.readline(), timeout=remaining)
+
+@functools.lru_cache(maxsize=1)
+def _probe_uvx(uvx_path, mtime_ns):
+    """Run `uvx --version` once per binary; '' means uvx is present but misbehaving"""
+    try:
+        result = subprocess.run([uvx_path, '--version'], capture_output=True, timeout=5)
+    except subprocess.TimeoutExpired:
+        return ''
+    return result.stdout.strip().decode(errors='replace') if result.returncode == 0 else ''
+
+def _uvx_version(search_path=None):
+    """Return the uvx version string, '' if it is broken, or None if it is not installed"""
+    uvx_path = shutil.which('uvx', path=search_path)
+    if not uvx_path:
+        return None
+    return _probe_uvx(uvx_path, os.stat(uvx_path).st_mtime_ns)
 
 def test_filesystem_mcp():
     """Test the filesystem MCP server"""
+    return asyncio.run(_check_filesystem_mcp())
+
+async def _check_filesystem_mcp():
+    """Drive the filesystem MCP server handshake over an asyncio subprocess"""
     print("🧪 Testing Filesystem MCP Server")
     print("=" * 40)
     
+    process = None
     try:
-        # Set up environment
-        env = os.environ.copy()
-        env['PATH'] = f"{os.path.expanduser('~/.local/bin')}:{env.get('PATH', '')}"
-        env['ALLOWED_DIRECTORIES'] = "/tmp,/data,."
+        # Bail out before spawning anything if uvx isn't installed
+        if _uvx_version(_MCP_ENV['PATH']) is None:
+            print("❌ uvx not found. Please install uv first.")
+            return False
         
         # Start the MCP server
         print("Starting filesystem MCP server...")
-        process = subprocess.Popen([
-            'uvx', 'mcp-server-filesystem@latest'
-        ], 
-        stdin=subprocess.PIPE, 
-        stdout=subprocess.PIPE, 
-        stderr=subprocess.PIPE,
-        text=True,
-        env=env
+        process = await asyncio.create_subprocess_exec(
+            'uvx', 'mcp-server-filesystem@latest',
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=_MCP_ENV
         )
         
         # Send initialization request
@@ -52,13 +104,6 @@ def test_filesystem_mcp():
             }
         }
         
-        print("Sending initialization request...")
-        process.stdin.write(json.dumps(init_request) + '\n')
-        process.stdin.flush()
-        
-        # Wait for response
-        time.sleep(2)
-        
         # Send list tools request
         tools_request = {
             "jsonrpc": "2.0",
@@ -66,49 +111,52 @@ def test_filesystem_mcp():
             "method": "tools/list"
         }
         
+        # Both requests go out back-to-back; the reader waits only as long as the server takes
+        print("Sending initialization request...")
+        process.stdin.write(_encode_rpc(init_request))
         print("Requesting available tools...")
-        process.stdin.write(json.dumps(tools_request) + '\n')
-        process.stdin.flush()
-        
-        # Wait for response
-        time.sleep(2)
+        process.stdin.write(_encode_rpc(tools_request))
+        await process.stdin.drain()
         
-        # Try to read responses
+        # Try to read responses; both replies share one 3s budget and each read
+        # returns as soon as its line arrives
+        deadline = asyncio.get_running_loop().time() + 3
         try:
-            # Set a timeout for reading
-            import select
-            ready, _, _ = select.select([process.stdout], [], [], 3)
-            
-            if ready:
-                response = process.stdout.readline()
-                if response:
-                    print(f"✅ MCP Response received: {response.strip()[:100]}...")
-                    
-                    # Try to parse as JSON
-                    try:
-                        response_data = json.loads(response)
-                        if 'result' in response_data:
-                            print("✅ MCP server is working!")
-                            if 'tools' in response_data['result']:
-                                tools = response_data['result']['tools']
-                                print(f"Available tools: {len(tools)}")
-                                for tool in tools[:3]:  # Show first 3 tools
-                                    print(f"  - {tool.get('name', 'Unknown')}: {tool.get('description', 'No description')}")
-                        else:
-                            print("✅ MCP server responded (initialization)")
-                    except json.JSONDecodeError:
-                        print("✅ MCP server responded (non-JSON)")
-                else:
-                    print("⚠️  No response from MCP server")
+            response = await _readline_before(process.stdout, deadline)
+            if response:
+                print(f"✅ MCP Response received: {response.decode().strip()[:100]}...")
+                
+                # Try to parse as JSON
+                try:
+                    response_data = _decode_rpc(response)
+                    if 'result' in response_data:
+                        print("✅ MCP server is working!")
+                        if 'tools' not in response_data['result']:
+                            # That was the initialize reply; the tools/list reply follows
+                            try:
+                                response_data = _decode_rpc(await _readline_before(process.stdout, deadline) or b'{}')
+                            except asyncio.TimeoutError:
+                                print("⚠️  Timeout waiting for tools/list response")
+                        tools = response_data.get('result', {}).get('tools')
+                        if tools:
+                            print(f"Available tools: {len(tools)}")
+                            for tool in tools[:3]:  # Show first 3 tools
+                                print(f"  - {tool.get('name', 'Unknown')}: {tool.get('description', 'No description')}")
+                    else:
+                        print("✅ MCP server responded (initialization)")
+                except json.JSONDecodeError:
+                    print("✅ MCP server responded (non-JSON)")
             else:
-                print("⚠️  Timeout waiting for MCP response")
+                print("⚠️  No response from MCP server")
                 
+        except asyncio.TimeoutError:
+            print("⚠️  Timeout waiting for MCP response")
         except Exception as e:
             print(f"⚠️  Error reading MCP response: {e}")
         
         # Clean up
         process.terminate()
-        process.wait(timeout=5)
+        await asyncio.wait_for(process.wait(), timeout=5)
         
         print("✅ MCP test completed successfully!")
         return True
@@ -116,7 +164,7 @@ def test_filesystem_mcp():
     except FileNotFoundError:
         print("❌ uvx not found. Please install uv first.")
         return False
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         print("⚠️  MCP server timeout")
         process.kill()
         return False
@@ -130,8 +178,7 @@ def test_mcp_configuration():
     print("=" * 40)
     
     try:
-        with open('.kiro/settings/mcp.json', 'r') as f:
-            config = json.load(f)
+        config = load_mcp_config()
         
         servers = config.get('mcpServers', {})
         print(f"✅ Found {len(servers)} configured MCP servers")
@@ -140,14 +187,13 @@ def test_mcp_configuration():
         print(f"✅ {len(enabled_servers)} servers enabled")
         
         # Check uvx availability
-        try:
-            result = subprocess.run(['uvx', '--version'], capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                print(f"✅ uvx available: {result.stdout.strip()}")
-            else:
-                print("⚠️  uvx not working properly")
-        except (subprocess.TimeoutExpired, FileNotFoundError):
+        uvx_version = _uvx_version()
+        if uvx_version is None:
             print("❌ uvx not available")
+        elif uvx_version:
+            print(f"✅ uvx available: {uvx_version}")
+        else:
+            print("⚠️  uvx not working properly")
         
         return True
         
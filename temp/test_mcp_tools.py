@@ -5,14 +5,16 @@ Tests the integration and functionality of MCP tools for analytics
 """
 
 import asyncio
-import json
 import sys
-import os
+from pathlib import Path
 
-# Add agent directory to path
-sys.path.append('agent')
+# Add agent directory to path once, independent of the working directory
+AGENT_DIR = str(Path(__file__).resolve().parent.parent / 'agent')
+if AGENT_DIR not in sys.path:
+    sys.path.insert(0, AGENT_DIR)
 
 from mcp_analytics_tools import MCPAnalyticsTools
+from mcp_test_helpers import load_mcp_config
 
 async def test_mcp_tools():
     """
@@ -26,7 +28,7 @@ async def test_mcp_tools():
     
     # Test 1: Check tool status
     print("\n📊 Tool Status Check:")
-    status = mcp_tools.get_tool_status()
+    status = mcp_tools.tool_status
     print(f"Total tools configured: {status['total_tools']}")
     print(f"Active tools: {status['active_tools']}")
     print("Available tools:")
@@ -44,9 +46,8 @@ async def test_mcp_tools():
         "Query Athena for customer data trends"
     ]
     
-    for query in test_queries:
+    for query, relevant_tools in zip(test_queries, mcp_tools.get_relevant_tools_for_queries(test_queries)):
         print(f"\nQuery: '{query}'")
-        relevant_tools = mcp_tools.get_relevant_tools_for_query(query)
         if relevant_tools:
             for tool_info in relevant_tools:
                 print(f"  🔧 {tool_info['tool']} - {tool_info['relevance']} relevance")
@@ -58,62 +59,76 @@ async def test_mcp_tools():
     # Test 3: Individual tool calls
     print("\n🛠️  Testing Individual Tool Calls:")
     
+    # The individual calls and the error case are independent, so run them concurrently
+    outcomes = await asyncio.gather(
+        mcp_tools.call_mcp_tool(
+            'aws-docs', 
+            'search_aws_docs', 
+            {'query': 'S3 analytics best practices'}
+        ),
+        mcp_tools.call_mcp_tool(
+            'postgres',
+            'query_database',
+            {'query': 'SELECT * FROM sales_data LIMIT 5'}
+        ),
+        mcp_tools.call_mcp_tool(
+            'data-analysis',
+            'analyze_dataset',
+            {'dataset': 'sample_sales_data.csv', 'analysis_type': 'descriptive_statistics'}
+        ),
+        mcp_tools.call_mcp_tool(
+            'visualization',
+            'create_chart',
+            {'chart_type': 'bar', 'data': {'x': ['A', 'B', 'C'], 'y': [1, 2, 3]}}
+        ),
+        mcp_tools.call_mcp_tool(
+            'nonexistent-tool',
+            'fake_function',
+            {'param': 'value'}
+        ),
+        return_exceptions=True
+    )
+    aws_result, db_result, analysis_result, viz_result, error_result = (
+        {'success': False, 'error': str(outcome)} if isinstance(outcome, Exception) else outcome
+        for outcome in outcomes
+    )
+    
     # Test AWS docs search
     print("\n1. Testing AWS Docs Search:")
-    aws_result = await mcp_tools.call_mcp_tool(
-        'aws-docs', 
-        'search_aws_docs', 
-        {'query': 'S3 analytics best practices'}
-    )
     print(f"   Success: {aws_result['success']}")
-    if aws_result['success']:
-        result = aws_result['result']
-        print(f"   Found {result.get('total_results', 0)} documents")
-        if result.get('documents'):
-            doc = result['documents'][0]
-            print(f"   Top result: {doc.get('title', 'N/A')}")
+    match aws_result:
+        case {'success': True, 'result': {'documents': [top_doc, *_]} as result}:
+            print(f"   Found {result.get('total_results', 0)} documents")
+            print(f"   Top result: {top_doc.get('title', 'N/A')}")
+        case {'success': True, 'result': result}:
+            print(f"   Found {result.get('total_results', 0)} documents")
     
     # Test database query
     print("\n2. Testing Database Query:")
-    db_result = await mcp_tools.call_mcp_tool(
-        'postgres',
-        'query_database',
-        {'query': 'SELECT * FROM sales_data LIMIT 5'}
-    )
     print(f"   Success: {db_result['success']}")
-    if db_result['success']:
-        result = db_result['result']
-        print(f"   Returned {result.get('row_count', 0)} rows")
-        print(f"   Execution time: {result.get('execution_time_ms', 0)}ms")
+    match db_result:
+        case {'success': True, 'result': result}:
+            print(f"   Returned {result.get('row_count', 0)} rows")
+            print(f"   Execution time: {result.get('execution_time_ms', 0)}ms")
     
     # Test data analysis
     print("\n3. Testing Data Analysis:")
-    analysis_result = await mcp_tools.call_mcp_tool(
-        'data-analysis',
-        'analyze_dataset',
-        {'dataset': 'sample_sales_data.csv', 'analysis_type': 'descriptive_statistics'}
-    )
     print(f"   Success: {analysis_result['success']}")
-    if analysis_result['success']:
-        result = analysis_result['result']
-        stats = result.get('summary_statistics', {})
-        print(f"   Dataset: {stats.get('row_count', 0)} rows, {stats.get('column_count', 0)} columns")
-        insights = result.get('insights', [])
-        if insights:
-            print(f"   Key insight: {insights[0]}")
+    match analysis_result:
+        case {'success': True, 'result': result}:
+            stats = result.get('summary_statistics', {})
+            print(f"   Dataset: {stats.get('row_count', 0)} rows, {stats.get('column_count', 0)} columns")
+            match result:
+                case {'insights': [first_insight, *_]}:
+                    print(f"   Key insight: {first_insight}")
     
     # Test visualization
     print("\n4. Testing Visualization:")
-    viz_result = await mcp_tools.call_mcp_tool(
-        'visualization',
-        'create_chart',
-        {'chart_type': 'bar', 'data': {'x': ['A', 'B', 'C'], 'y': [1, 2, 3]}}
-    )
     print(f"   Success: {viz_result['success']}")
-    if viz_result['success']:
-        result = viz_result['result']
-        print(f"   Chart ID: {result.get('chart_id', 'N/A')}")
-        print(f"   Chart type: {result.get('chart_type', 'N/A')}")
+    match viz_result:
+        case {'success': True, 'result': result}:
+            print(f"   Chart ID: {result.get('chart_id', 'N/A')}")
+            print(f"   Chart type: {result.get('chart_type', 'N/A')}")
     
     # Test 4: Full workflow execution
     print("\n🔄 Testing Complete Analytics Workflow:")
@@ -136,13 +151,28 @@ async def test_mcp_tools():
         for rec in workflow_result['recommendations']:
             print(f"  💡 {rec}")
     
+    # Dependency-aware workflow: independent steps run concurrently
+    print("\n🔀 Testing Dependency Graph Workflow:")
+    dag_result = await mcp_tools.execute_dag([
+        {'id': 'docs', 'tool': 'aws-docs', 'function': 'search_aws_docs',
+         'parameters': {'query': 'S3 analytics best practices'}},
+        {'id': 'sales', 'tool': 'postgres', 'function': 'query_database',
+         'parameters': {'query': 'SELECT * FROM sales_data LIMIT 5'}},
+        {'id': 'analysis', 'tool': 'data-analysis', 'function': 'analyze_dataset',
+         'parameters': {'dataset': 'sample_sales_data.csv', 'analysis_type': 'descriptive_statistics'},
+         'depends_on': ['sales']},
+        {'id': 'chart', 'tool': 'visualization', 'function': 'create_chart',
+         'parameters': {'chart_type': 'bar', 'data': {'x': ['A', 'B', 'C'], 'y': [1, 2, 3]}},
+         'depends_on': ['analysis']}
+    ])
+    
+    print(f"DAG success: {dag_result['success']}")
+    for step in dag_result['workflow_steps']:
+        status_icon = "✅" if step['success'] else "❌"
+        print(f"  {status_icon} {step['id']}: {step['tool']}.{step['function']}")
+    
     # Test 5: Error handling
     print("\n⚠️  Testing Error Handling:")
-    error_result = await mcp_tools.call_mcp_tool(
-        'nonexistent-tool',
-        'fake_function',
-        {'param': 'value'}
-    )
     print(f"Error handling works: {not error_result['success']}")
     if not error_result['success']:
         print(f"Error message: {error_result.get('error', 'N/A')}")
@@ -156,6 +186,7 @@ async def test_mcp_tools():
     print(f"   • Query analysis: ✅") 
     print(f"   • Individual tool calls: ✅")
     print(f"   • Workflow execution: ✅")
+    print(f"   • Dependency graph execution: ✅")
     print(f"   • Error handling: ✅")
 
 def test_mcp_configuration():
@@ -165,8 +196,7 @@ def test_mcp_configuration():
     print("\n🔧 Testing MCP Configuration:")
     
     try:
-        with open('.kiro/settings/mcp.json', 'r') as f:
-            config = json.load(f)
+        config = load_mcp_config()
         
         servers = config.get('mcpServers', {})
         print(f"Configured MCP servers: {len(servers)}")